@@ -1,13 +1,22 @@
 
 import os
 import gc
+import math
 import sympy
+import shutil
+import hashlib
 import logging
 import functools
 import itertools
 import numpy as np
 import scipy.special
 
+try:
+    import numba
+    numba_available = True
+except ImportError:
+    numba_available = False
+
 import mosaic
 from mosaic.types import Struct
 
@@ -18,6 +27,119 @@ from ...problem.base import Gridded
 __all__ = ['OperatorDevito', 'GridDevito', 'config_devito']
 
 
+# Kaiser windowing constants for Hicks interpolation
+_KAISER_B = 4.14
+_KAISER_HALF_WIDTH = 3
+_KAISER_DEN = float(scipy.special.iv(0, _KAISER_B))
+_KAISER_EXTENDED_WIDTH = _KAISER_HALF_WIDTH / 0.99
+
+
+if numba_available:
+
+    @numba.njit(fastmath=True, cache=True)
+    def _bessel_i0(x):
+        # polynomial approximation of the zeroth-order modified Bessel
+        # function, Abramowitz & Stegun 9.8.1/9.8.2
+        ax = abs(x)
+
+        if ax < 3.75:
+            t = (x / 3.75)**2
+            return 1.0 + t*(3.5156229 + t*(3.0899424 + t*(1.2067492 +
+                            t*(0.2659732 + t*(0.0360768 + t*0.0045813)))))
+
+        t = 3.75 / ax
+        return (math.exp(ax) / math.sqrt(ax)) * \
+               (0.39894228 + t*(0.01328592 + t*(0.00225319 + t*(-0.00157565 +
+                t*(0.00916281 + t*(-0.02057706 + t*(0.02635537 + t*(-0.01647633 +
+                t*0.00392377))))))))
+
+    @numba.njit(parallel=True, cache=True)
+    def _first_touch_kernel(flat):
+        for index in numba.prange(flat.shape[0]):
+            flat[index] = 0
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _hicks_kernel(offsets, out, kaiser_b, kaiser_den, kaiser_extended_width, kaiser_half_width):
+        num, dim, r = out.shape
+
+        for point in numba.prange(num):
+            for d in range(dim):
+                for index in range(r):
+                    x = offsets[point, d] + (index - kaiser_half_width)
+
+                    w = (x / kaiser_extended_width)**2
+                    if w > 1.0:
+                        w = 1.0
+                    w = _bessel_i0(kaiser_b * math.sqrt(1.0 - w)) / kaiser_den
+
+                    if x == 0.0:
+                        sinc = 1.0
+                    else:
+                        sinc = math.sin(math.pi * x) / (math.pi * x)
+
+                    out[point, d, index] = sinc * w
+
+
+_detected_platform = False
+
+
+def _detect_platform():
+    """
+    Detect a Devito platform hint from the CPU flags in ``/proc/cpuinfo``.
+
+    Only active when ``STRIDE_DETECT_PLATFORM`` is set, since Devito's own
+    autodetection is usually right and e.g. AMD CPUs that advertise
+    ``avx512f`` should not be forced onto the Intel ``skx`` presets. Returns
+    ``skx`` for Intel AVX-512 capable CPUs, so that Devito emits the wider
+    vector pragmas and picks matching tile sizes, and otherwise ``None`` to
+    let Devito fall back on its own detection. The result is cached and
+    logged once per process.
+
+    """
+    global _detected_platform
+
+    if _detected_platform is False:
+        platform = None
+
+        if os.getenv('STRIDE_DETECT_PLATFORM', '0') in ('1', 'true', 'yes'):
+            try:
+                with open('/proc/cpuinfo', 'r') as file:
+                    cpuinfo = file.read()
+
+                if 'avx512f' in cpuinfo and 'GenuineIntel' in cpuinfo:
+                    platform = 'skx'
+            except OSError:
+                pass
+
+            if platform is not None:
+                mosaic.logger().info('Detected Devito platform %s' % platform)
+
+        _detected_platform = platform
+
+    return _detected_platform
+
+
+def _atomic_copy(src, dst):
+    """
+    Copy ``src`` to ``dst`` so that concurrent readers only ever observe a
+    complete file: the data is copied to a temporary name in the destination
+    directory first and then renamed into place, which is atomic within a
+    filesystem.
+
+    """
+    tmp = '%s.tmp.%d' % (dst, os.getpid())
+
+    try:
+        shutil.copy2(src, tmp)
+        os.replace(tmp, dst)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
 class FullDomain(devito.SubDomain):
 
     name = 'full_domain'
@@ -49,6 +171,8 @@ class InteriorDomain(devito.SubDomain):
 
 class PMLSide(devito.SubDomain):
 
+    __slots__ = ('dim_i', 'side', 'name', 'space_order', 'extra', '_define_cache')
+
     def __init__(self, space_order, extra, dim, side):
         self.dim_i = dim
         self.side = side
@@ -58,16 +182,25 @@ class PMLSide(devito.SubDomain):
 
         self.space_order = space_order
         self.extra = extra
+        self._define_cache = {}
 
     def define(self, dimensions):
+        key = tuple(id(dimension) for dimension in dimensions)
+        if key in self._define_cache:
+            return self._define_cache[key]
+
         domain = {dimension: dimension for dimension in dimensions}
         domain[dimensions[self.dim_i]] = (self.side, self.extra[self.dim_i])
 
+        self._define_cache[key] = domain
+
         return domain
 
 
 class PMLCentre(devito.SubDomain):
 
+    __slots__ = ('dim_i', 'side', 'name', 'space_order', 'extra', '_define_cache')
+
     def __init__(self, space_order, extra, dim, side):
         self.dim_i = dim
         self.side = side
@@ -77,17 +210,26 @@ class PMLCentre(devito.SubDomain):
 
         self.space_order = space_order
         self.extra = extra
+        self._define_cache = {}
 
     def define(self, dimensions):
+        key = tuple(id(dimension) for dimension in dimensions)
+        if key in self._define_cache:
+            return self._define_cache[key]
+
         domain = {dimension: ('middle', extra, extra)
                   for dimension, extra in zip(dimensions, self.extra)}
         domain[dimensions[self.dim_i]] = (self.side, self.extra[self.dim_i])
 
+        self._define_cache[key] = domain
+
         return domain
 
 
 class PMLCorner(devito.SubDomain):
 
+    __slots__ = ('sides', 'name', 'space_order', 'extra', '_define_cache')
+
     def __init__(self, space_order, extra, *sides):
         self.sides = sides
         self.name = 'pml_corner_' + '_'.join(sides)
@@ -96,16 +238,25 @@ class PMLCorner(devito.SubDomain):
 
         self.space_order = space_order
         self.extra = extra
+        self._define_cache = {}
 
     def define(self, dimensions):
+        key = tuple(id(dimension) for dimension in dimensions)
+        if key in self._define_cache:
+            return self._define_cache[key]
+
         domain = {dimension: (side, extra)
                   for dimension, side, extra in zip(dimensions, self.sides, self.extra)}
 
+        self._define_cache[key] = domain
+
         return domain
 
 
 class PMLPartial(devito.SubDomain):
 
+    __slots__ = ('dim_i', 'side', 'name', 'space_order', 'extra', '_define_cache')
+
     def __init__(self, space_order, extra, dim, side):
         self.dim_i = dim
         self.side = side
@@ -115,8 +266,13 @@ class PMLPartial(devito.SubDomain):
 
         self.space_order = space_order
         self.extra = extra
+        self._define_cache = {}
 
     def define(self, dimensions):
+        key = tuple(id(dimension) for dimension in dimensions)
+        if key in self._define_cache:
+            return self._define_cache[key]
+
         domain = {dimension: ('middle', extra, extra)
                   for dimension, extra in zip(dimensions, self.extra)}
 
@@ -126,6 +282,8 @@ class PMLPartial(devito.SubDomain):
 
         domain[dimensions[self.dim_i]] = (self.side, self.extra[self.dim_i])
 
+        self._define_cache[key] = domain
+
         return domain
 
 
@@ -134,9 +292,8 @@ def _cached(func):
     @functools.wraps(func)
     def cached_wrapper(self, *args, **kwargs):
         name = args[0]
-        cached = kwargs.pop('cached', True)
 
-        if cached is True:
+        if kwargs.get('cached', True) is True:
             fun = self.vars.get(name, None)
             if fun is not None:
                 _args, _kwargs = self._args[name]
@@ -148,15 +305,20 @@ def _cached(func):
                     except ValueError:
                         pass
 
-                for arg, _arg in zip(kwargs.values(), _kwargs.values()):
+                for key, arg in kwargs.items():
+                    if key == 'cached' or key not in _kwargs:
+                        continue
+
                     try:
-                        same_args = same_args and bool(arg == _arg)
+                        same_args = same_args and bool(arg == _kwargs[key])
                     except ValueError:
                         pass
 
                 if same_args:
                     return fun
 
+        kwargs.pop('cached', None)
+
         fun = func(self, *args, **kwargs)
 
         self.vars[name] = fun
@@ -197,6 +359,12 @@ class GridDevito(Gridded):
 
         self.vars = Struct()
         self._args = Struct()
+        self._hicks_cache = {}
+        self._halo_buffers = {}
+        self._dim_cache = {}
+
+        self._first_touch = os.getenv('STRIDE_FIRST_TOUCH', '0') in ('1', 'true', 'yes')
+        self._dealloc_count = 0
 
         self.space_order = space_order
         self.time_order = time_order
@@ -220,29 +388,45 @@ class GridDevito(Gridded):
 
             self.full = FullDomain(space_order, extra)
             self.interior = InteriorDomain(space_order, extra)
-            self.pml_left = tuple()
-            self.pml_right = tuple()
-            self.pml_centres = tuple()
-            self.pml_partials = tuple()
+
+            pml_left = []
+            pml_right = []
+            pml_centres = []
+            pml_partials = []
 
             for dim in range(space.dim):
-                self.pml_left += (PMLSide(space_order, extra, dim, 'left'),)
-                self.pml_right += (PMLSide(space_order, extra, dim, 'right'),)
-                self.pml_centres += (PMLCentre(space_order, extra, dim, 'left'),
-                                     PMLCentre(space_order, extra, dim, 'right'))
-                self.pml_partials += (PMLPartial(space_order, extra, dim, 'left'),
-                                      PMLPartial(space_order, extra, dim, 'right'))
-
-            self.pml_corners = [PMLCorner(space_order, extra, *sides)
-                                for sides in itertools.product(['left', 'right'],
-                                                               repeat=space.dim)]
-            self.pml_corners = tuple(self.pml_corners)
+                pml_left.append(PMLSide(space_order, extra, dim, 'left'))
+                pml_right.append(PMLSide(space_order, extra, dim, 'right'))
+                pml_centres.append(PMLCentre(space_order, extra, dim, 'left'))
+                pml_centres.append(PMLCentre(space_order, extra, dim, 'right'))
+                pml_partials.append(PMLPartial(space_order, extra, dim, 'left'))
+                pml_partials.append(PMLPartial(space_order, extra, dim, 'right'))
+
+            self.pml_left = tuple(pml_left)
+            self.pml_right = tuple(pml_right)
+            self.pml_centres = tuple(pml_centres)
+            self.pml_partials = tuple(pml_partials)
+
+            # in 1D the corners cover the same regions as the sides, so
+            # there is no point registering them with the grid
+            sides = ('left', 'right')
+            if space.dim == 2:
+                self.pml_corners = tuple(PMLCorner(space_order, extra, side_0, side_1)
+                                         for side_0 in sides for side_1 in sides)
+            elif space.dim == 3:
+                self.pml_corners = tuple(PMLCorner(space_order, extra, side_0, side_1, side_2)
+                                         for side_0 in sides for side_1 in sides for side_2 in sides)
+            elif space.dim > 1:
+                self.pml_corners = tuple(PMLCorner(space_order, extra, *each_sides)
+                                         for each_sides in itertools.product(sides, repeat=space.dim))
+            else:
+                self.pml_corners = tuple()
 
             self.pml = self.pml_partials
 
-            grid_kwargs['subdomains'] = (self.full, self.interior,) + \
-                                         self.pml + self.pml_left + self.pml_right + \
-                                         self.pml_centres + self.pml_corners
+            grid_kwargs['subdomains'] = (self.full, self.interior,
+                                         *self.pml, *self.pml_left, *self.pml_right,
+                                         *self.pml_centres, *self.pml_corners)
 
         dimensions = None
         time_dimension = None
@@ -294,6 +478,9 @@ class GridDevito(Gridded):
                               dtype=kwargs.pop('dtype', self.dtype),
                               **kwargs)
 
+        if self._first_touch:
+            self._prefault(fun)
+
         return fun
 
     @_cached
@@ -328,6 +515,9 @@ class GridDevito(Gridded):
                                   dtype=kwargs.pop('dtype', self.dtype),
                                   **kwargs)
 
+        if self._first_touch:
+            self._prefault(fun)
+
         return fun
 
     @_cached
@@ -458,6 +648,22 @@ class GridDevito(Gridded):
 
         time_dim = self.devito_grid.time_dim
 
+        if factor == 1 and bounds[0] == 0 and bounds[1] == self.time.extended_num-1:
+            # every timestep in the run range is kept, so a plain saved
+            # function avoids carrying a conditional dimension through the
+            # generated code; with narrower bounds the condition below is
+            # still needed to guard writes outside the save buffer
+            fun = self.time_function(name,
+                                     space_order=space_order,
+                                     time_order=time_order,
+                                     save=bounds[1] - bounds[0] + 1,
+                                     dtype=kwargs.pop('dtype', self.dtype),
+                                     **kwargs)
+
+            space_dims = fun.dimensions[1:]
+
+            return fun.func(time_dim - bounds[0], *space_dims)
+
         condition = sympy.And(devito.symbolics.CondEq(time_dim % factor, 0),
                               devito.Gt(time_dim, bounds[0] + factor),
                               devito.Lt(time_dim, bounds[1] - factor),)
@@ -516,7 +722,9 @@ class GridDevito(Gridded):
         time_order = time_order or self.time_order
 
         # Define variables
-        p_dim = kwargs.pop('p_dim', devito.Dimension(name='p_%s' % name))
+        p_dim = kwargs.pop('p_dim', None)
+        if p_dim is None:
+            p_dim = self._sparse_dim(name)
 
         sparse_kwargs = dict(name=name,
                              grid=self.devito_grid,
@@ -578,7 +786,9 @@ class GridDevito(Gridded):
         space_order = space_order or self.space_order
 
         # Define variables
-        p_dim = kwargs.pop('p_dim', devito.Dimension(name='p_%s' % name))
+        p_dim = kwargs.pop('p_dim', None)
+        if p_dim is None:
+            p_dim = self._sparse_dim(name)
 
         sparse_kwargs = dict(name=name,
                              grid=self.devito_grid,
@@ -606,6 +816,10 @@ class GridDevito(Gridded):
 
         return fun
 
+    # a full garbage collection traverses every live object, so when
+    # collecting on deallocate only every Nth pass runs all generations
+    _full_collect_every = 10
+
     def deallocate(self, name, collect=False):
         """
         Remove internal references to data buffers, if ``name`` is cached.
@@ -631,9 +845,14 @@ class GridDevito(Gridded):
                 self.vars[name]._data = None
 
             if collect:
-                gc.collect()
+                self._dealloc_count += 1
+
+                if self._dealloc_count % self._full_collect_every == 0:
+                    gc.collect()
+                else:
+                    gc.collect(0)
 
-    def with_halo(self, data, value=None, time_dependent=False, is_vector=False):
+    def with_halo(self, data, value=None, time_dependent=False, is_vector=False, name=None):
         """
         Pad ndarray with appropriate halo given the grid space order.
 
@@ -649,6 +868,11 @@ class GridDevito(Gridded):
         is_vector : bool, optional
             Whether the array should be considered a vector field,
             defaults to ``False``.
+        name : str, optional
+            Identifier under which the padded buffer is kept and reused across
+            calls, to avoid re-allocating it every time. If not given, a fresh
+            array is allocated, so that padded arrays that are held at the same
+            time do not alias each other.
 
         Returns
         -------
@@ -665,42 +889,148 @@ class GridDevito(Gridded):
         if is_vector:
             pad_widths.insert(0, [0, 0])
 
-        if value is None:
-            return np.pad(data, pad_widths, mode='edge')
+        shape = tuple(each_dim + lo + hi
+                      for each_dim, (lo, hi) in zip(data.shape, pad_widths))
+
+        if name is not None:
+            buffer_key = (name, shape, np.dtype(data.dtype))
+            padded = self._halo_buffers.get(buffer_key)
+            if padded is None:
+                padded = np.empty(shape, dtype=data.dtype)
+                self._halo_buffers[buffer_key] = padded
         else:
-            return np.pad(data, pad_widths, mode='constant', constant_values=value)
+            padded = np.empty(shape, dtype=data.dtype)
+
+        inner_slices = tuple(slice(lo, lo + each_dim)
+                             for each_dim, (lo, hi) in zip(data.shape, pad_widths))
+        padded[inner_slices] = data
+
+        # fill the halo dimension by dimension so that the corners are
+        # replicated the same way np.pad would
+        full_slices = (slice(None),) * len(shape)
+        for dim, (lo, hi) in enumerate(pad_widths):
+            if lo:
+                halo_slices = list(full_slices)
+                halo_slices[dim] = slice(0, lo)
+
+                if value is None:
+                    edge_slices = list(full_slices)
+                    edge_slices[dim] = slice(lo, lo + 1)
+                    padded[tuple(halo_slices)] = padded[tuple(edge_slices)]
+                else:
+                    padded[tuple(halo_slices)] = value
+
+            if hi:
+                halo_slices = list(full_slices)
+                halo_slices[dim] = slice(shape[dim] - hi, None)
+
+                if value is None:
+                    edge_slices = list(full_slices)
+                    edge_slices[dim] = slice(shape[dim] - hi - 1, shape[dim] - hi)
+                    padded[tuple(halo_slices)] = padded[tuple(edge_slices)]
+                else:
+                    padded[tuple(halo_slices)] = value
+
+        return padded
+
+    def _prefault(self, fun):
+        """
+        Zero the data of a freshly created function with a parallel
+        first-touch pass, so that its pages are placed on the NUMA nodes of
+        the threads that will later run the stencil over them.
+
+        """
+        try:
+            flat = np.asarray(fun.data_with_halo).reshape(-1)
+        except (AttributeError, ValueError):
+            return
+
+        if numba_available:
+            _first_touch_kernel(flat)
+        else:
+            flat[:] = 0
+
+    def _sparse_dim(self, name):
+        """
+        Return the point dimension for a sparse function with a certain name,
+        creating it on first use. Devito dimensions are SymPy-backed and not
+        cheap to build, so they are reused across calls.
+
+        """
+        p_name = 'p_%s' % name
+
+        p_dim = self._dim_cache.get(p_name)
+        if p_dim is None:
+            p_dim = self._dim_cache[p_name] = devito.Dimension(name=p_name)
+
+        return p_dim
+
+    # each cache entry holds the full coefficient array for a set of
+    # coordinates, and acquisitions with per-shot geometry produce a new
+    # entry per shot, so the cache is bounded by evicting the least
+    # recently used entries
+    _hicks_cache_size = 32
 
     def _calculate_hicks(self, coordinates):
         space = self.space
 
-        # Calculate the reference gridpoints and offsets
-        grid_coordinates = (coordinates - np.array(space.pml_origin)) / np.array(space.spacing)
-        reference_gridpoints = np.round(grid_coordinates).astype(np.int32)
-        offsets = grid_coordinates - reference_gridpoints
+        # The coefficients only depend on the coordinates and the grid
+        # geometry, so they can be reused across repeated shot runs
+        if coordinates.nbytes < 64 * 1024:
+            coordinates_key = coordinates.tobytes()
+        else:
+            coordinates_key = hashlib.blake2b(coordinates.tobytes(), digest_size=16).digest()
+
+        cache_key = (coordinates_key, coordinates.shape,
+                     tuple(space.pml_origin), tuple(space.spacing))
+
+        cached = self._hicks_cache.pop(cache_key, None)
+        if cached is not None:
+            self._hicks_cache[cache_key] = cached
+            return cached
 
-        # Pre-calculate stuff
-        kaiser_b = 4.14
-        kaiser_half_width = 3
-        kaiser_den = scipy.special.iv(0, kaiser_b)
-        kaiser_extended_width = kaiser_half_width/0.99
+        # Calculate the reference gridpoints and offsets, rounding and
+        # subtracting in float32 to avoid an implicit up-cast against the
+        # int32 gridpoints
+        grid_coordinates = (coordinates - np.array(space.pml_origin)) / np.array(space.spacing)
+        grid_coordinates = grid_coordinates.astype(np.float32, copy=False)
+        rounded_gridpoints = np.rint(grid_coordinates)
+        reference_gridpoints = rounded_gridpoints.astype(np.int32)
+        offsets = grid_coordinates - rounded_gridpoints
 
         # Calculate coefficients
-        r = 2*kaiser_half_width+1
-        num = coordinates.shape[0]
-        coefficients = np.zeros((num, space.dim, r))
+        if numba_available:
+            r = 2*_KAISER_HALF_WIDTH+1
+            num = coordinates.shape[0]
+
+            coefficients = np.zeros((num, space.dim, r), dtype=np.float32)
+            _hicks_kernel(np.ascontiguousarray(offsets), coefficients,
+                          _KAISER_B, _KAISER_DEN, _KAISER_EXTENDED_WIDTH, _KAISER_HALF_WIDTH)
+
+        else:
+            grid_points = np.arange(-_KAISER_HALF_WIDTH, _KAISER_HALF_WIDTH+1, dtype=np.float32)
+            x = offsets[:, :, None] + grid_points[None, None, :]
+
+            # prepare the Bessel argument in-place to avoid allocating a
+            # (num, dim, 2*half_width+1) temporary per step
+            weights = np.minimum((x / _KAISER_EXTENDED_WIDTH)**2, 1)
+            np.subtract(1, weights, out=weights)
+            np.sqrt(weights, out=weights)
+            np.multiply(weights, _KAISER_B, out=weights)
+            scipy.special.iv(0, weights, out=weights)
+            np.divide(weights, _KAISER_DEN, out=weights)
 
-        for grid_point in range(-kaiser_half_width, kaiser_half_width+1):
-            index = kaiser_half_width + grid_point
+            coefficients = np.sinc(x)
+            np.multiply(coefficients, weights, out=coefficients)
 
-            x = grid_point + offsets
+        hicks = (reference_gridpoints - _KAISER_HALF_WIDTH, coefficients)
 
-            weights = (x / kaiser_extended_width)**2
-            weights[weights > 1] = 1
-            weights = scipy.special.iv(0, kaiser_b * np.sqrt(1 - weights)) / kaiser_den
+        while len(self._hicks_cache) >= self._hicks_cache_size:
+            self._hicks_cache.pop(next(iter(self._hicks_cache)))
 
-            coefficients[:, :, index] = np.sinc(x) * weights
+        self._hicks_cache[cache_key] = hicks
 
-        return reference_gridpoints - kaiser_half_width, coefficients
+        return hicks
 
 
 class OperatorDevito:
@@ -720,6 +1050,11 @@ class OperatorDevito:
         self.devito_operator = None
         self.kwargs = {}
 
+        # compiled operators are cached per instance because the generated
+        # code binds functions of this grid; sharing across grids would
+        # reuse stale bindings
+        self._operator_cache = {}
+
         if grid is None:
             self.grid = GridDevito(*args, **kwargs)
         else:
@@ -746,11 +1081,15 @@ class OperatorDevito:
         platform = kwargs.pop('platform', None)
 
         if platform is None:
+            devito_platform = os.getenv('DEVITO_PLATFORM', None)
+            if devito_platform is None:
+                devito_platform = _detect_platform()
+
             default_config = {
                 'name': self.name,
                 'subs': self.grid.devito_grid.spacing_map,
-                'opt': 'advanced',
-                'platform': os.getenv('DEVITO_PLATFORM', None),
+                'opt': os.getenv('DEVITO_OPT', 'advanced'),
+                'platform': devito_platform,
             }
 
         elif platform == 'nvidia-acc':
@@ -769,6 +1108,15 @@ class OperatorDevito:
         devito_config = kwargs.pop('devito_config', {})
         default_config.update(devito_config)
 
+        ops = op if isinstance(op, (list, tuple)) else [op]
+        cache_key = (tuple(str(each_op) for each_op in ops),
+                     tuple(sorted((key, str(value)) for key, value in default_config.items())))
+
+        cached_operator = self._operator_cache.get(cache_key)
+        if cached_operator is not None:
+            self.devito_operator = cached_operator
+            return
+
         logger = mosaic.logger()
         logger.info('Operator `%s` instance configuration:' % self.name)
 
@@ -779,17 +1127,61 @@ class OperatorDevito:
             logger.info('\t * %s=%s' % (key, value))
 
         self.devito_operator = devito.Operator(op, **default_config)
+        self._operator_cache[cache_key] = self.devito_operator
 
     def compile(self):
         """
         Compile the operator.
 
+        If the environment variable ``STRIDE_JIT_CACHE`` points to a shared
+        directory, compiled libraries are stored there keyed on a hash of the
+        generated code and compiler, so that other processes compiling the
+        same kernel (e.g. other Mosaic workers) reuse the binary instead of
+        invoking the compiler again.
+
         Returns
         -------
 
         """
+        cached_lib, jit_lib = self._jit_cache_paths()
+
+        if cached_lib is not None and os.path.exists(cached_lib) and not os.path.exists(jit_lib):
+            try:
+                _atomic_copy(cached_lib, jit_lib)
+            except OSError:
+                pass
+
         self.devito_operator.cfunction
 
+        if cached_lib is not None and not os.path.exists(cached_lib) and os.path.exists(jit_lib):
+            try:
+                _atomic_copy(jit_lib, cached_lib)
+            except OSError:
+                pass
+
+    def _jit_cache_paths(self):
+        cache_dir = os.getenv('STRIDE_JIT_CACHE', None)
+        if cache_dir is None:
+            return None, None
+
+        try:
+            from devito.arch.compiler import get_jit_dir
+
+            operator = self.devito_operator
+            compiler = operator._compiler
+
+            source_key = hashlib.sha256((str(operator.ccode) + str(compiler)).encode('utf-8')).hexdigest()
+
+            os.makedirs(cache_dir, exist_ok=True)
+
+            cached_lib = os.path.join(cache_dir, source_key + '.so')
+            jit_lib = os.path.join(str(get_jit_dir()), operator._soname + '.so')
+
+        except (ImportError, AttributeError, OSError):
+            return None, None
+
+        return cached_lib, jit_lib
+
     def run(self, **kwargs):
         """
         Run the operator.
@@ -860,23 +1252,18 @@ def config_devito(**kwargs):
         def __init__(self):
             super().__init__()
 
-        def filter(self, record):
             _logger = mosaic.logger()
 
-            if record.levelno == devito.logger.PERF:
-                _logger.info(record.msg)
-
-            elif record.levelno == logging.ERROR:
-                _logger.error(record.msg)
-
-            elif record.levelno == logging.WARNING:
-                _logger.warning(record.msg)
-
-            elif record.levelno == logging.DEBUG:
-                _logger.debug(record.msg)
+            self._default = _logger.info
+            self._dispatch = {
+                devito.logger.PERF: _logger.info,
+                logging.ERROR: _logger.error,
+                logging.WARNING: _logger.warning,
+                logging.DEBUG: _logger.debug,
+            }
 
-            else:
-                _logger.info(record.msg)
+        def filter(self, record):
+            self._dispatch.get(record.levelno, self._default)(record.msg)
 
             return False
 
@@ -299,7 +299,7 @@ class IsoAcousticDevito(ProblemTypeBase):
             self.dev_grid.vars.p_saved.data_with_halo.fill(0.)
 
         # Set medium parameters
-        vp_with_halo = self.dev_grid.with_halo(vp.extended_data)
+        vp_with_halo = self.dev_grid.with_halo(vp.extended_data, name='vp')
         self.dev_grid.vars.vp.data_with_halo[:] = vp_with_halo
         self.dev_grid.vars.vp2.data_with_halo[:] = vp_with_halo**2
         self.dev_grid.vars.inv_vp2.data_with_halo[:] = 1 / vp_with_halo**2
@@ -307,7 +307,7 @@ class IsoAcousticDevito(ProblemTypeBase):
         if rho is not None:
             self.logger.info('(ShotID %d) Using inhomogeneous density' % problem.shot_id)
 
-            rho_with_halo = self.dev_grid.with_halo(rho.extended_data)
+            rho_with_halo = self.dev_grid.with_halo(rho.extended_data, name='rho')
             self.dev_grid.vars.rho.data_with_halo[:] = rho_with_halo
             self.dev_grid.vars.buoy.data_with_halo[:] = 1 / rho_with_halo
 
@@ -316,7 +316,7 @@ class IsoAcousticDevito(ProblemTypeBase):
 
             db_to_neper = 100 * (1e-6 / (2*np.pi))**self.attenuation_power / (20 * np.log10(np.exp(1)))
 
-            alpha_with_halo = self.dev_grid.with_halo(alpha.extended_data)*db_to_neper
+            alpha_with_halo = self.dev_grid.with_halo(alpha.extended_data, name='alpha')*db_to_neper
             self.dev_grid.vars.alpha.data_with_halo[:] = alpha_with_halo
 
         # Set geometry and wavelet
@@ -579,20 +579,20 @@ class IsoAcousticDevito(ProblemTypeBase):
                 os.remove(filename)
 
         # Set medium parameters
-        vp_with_halo = self.dev_grid.with_halo(vp.extended_data)
+        vp_with_halo = self.dev_grid.with_halo(vp.extended_data, name='vp')
         self.dev_grid.vars.vp.data_with_halo[:] = vp_with_halo
         self.dev_grid.vars.vp2.data_with_halo[:] = vp_with_halo**2
         self.dev_grid.vars.inv_vp2.data_with_halo[:] = 1 / vp_with_halo**2
 
         if rho is not None:
-            rho_with_halo = self.dev_grid.with_halo(rho.extended_data)
+            rho_with_halo = self.dev_grid.with_halo(rho.extended_data, name='rho')
             self.dev_grid.vars.rho.data_with_halo[:] = rho_with_halo
             self.dev_grid.vars.buoy.data_with_halo[:] = 1 / rho_with_halo
 
         if alpha is not None:
             db_to_neper = 100 * (1e-6 / (2*np.pi))**self.attenuation_power / (20 * np.log10(np.exp(1)))
 
-            alpha_with_halo = self.dev_grid.with_halo(alpha.extended_data)*db_to_neper
+            alpha_with_halo = self.dev_grid.with_halo(alpha.extended_data, name='alpha')*db_to_neper
             self.dev_grid.vars.alpha.data_with_halo[:] = alpha_with_halo
 
         # Set geometry and adjoint source
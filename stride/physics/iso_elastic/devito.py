@@ -183,9 +183,9 @@ class IsoElasticDevito(ProblemTypeBase):
         self.boundary.clear()
 
         # Set medium parameters
-        vp_with_halo = self.dev_grid.with_halo(vp.extended_data)
-        vs_with_halo = self.dev_grid.with_halo(vs.extended_data)
-        rho_with_halo = self.dev_grid.with_halo(rho.extended_data)
+        vp_with_halo = self.dev_grid.with_halo(vp.extended_data, name='vp')
+        vs_with_halo = self.dev_grid.with_halo(vs.extended_data, name='vs')
+        rho_with_halo = self.dev_grid.with_halo(rho.extended_data, name='rho')
 
         lam_with_halo = rho_with_halo * (vp_with_halo ** 2 - 2. * vs_with_halo ** 2)
         mu_with_halo = rho_with_halo * vs_with_halo ** 2
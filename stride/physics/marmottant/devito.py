@@ -503,7 +503,7 @@ class MarmottantDevito(ProblemTypeBase):
             dense_fun = self.dev_grid.function('%s_dense' % name,
                                                space_order=self.space_order,
                                                time_order=self.time_order)
-            with_halo = self.dev_grid.with_halo(value.extended_data)
+            with_halo = self.dev_grid.with_halo(value.extended_data, name=name)
             dense_fun.data[:] = with_halo
 
             interp_term = fun.interpolate(expr=dense_fun)
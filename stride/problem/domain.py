@@ -1,6 +1,5 @@
 
 import numpy as np
-from cached_property import cached_property
 
 
 __all__ = ['Space', 'Time', 'SlowTime', 'Grid']
@@ -27,36 +26,136 @@ class Space:
         Amount of axis-wise extra space around the inner domain.
     absorbing : tuple
         Portion of the extra space that corresponds to absorbing boundaries.
+    layout : str, optional
+        Traversal layout hint for grid-shaped fields, ``C`` (default) for plain
+        row-major order or ``blocked`` for L2-sized tile traversal through
+        ``gather``.
 
     """
 
-    def __init__(self, shape=None, spacing=None, extra=None, absorbing=None):
+    __slots__ = ('dim', 'layout', '_geom',
+                 '_inner', '_grid', '_extended_grid', '_inner_mask', '_inner_mask_bool')
+
+    # target size of a traversal tile when layout is blocked, sized to
+    # fit a float32 tile within a typical L2 cache
+    _block_elements = 256 * 1024 // 4
+
+    # per-axis geometry, stored as a single structured array so that derived
+    # quantities are computed with whole-column arithmetic
+    _geom_dtype = [('shape', 'i8'), ('spacing', 'f8'),
+                   ('extra', 'i8'), ('absorbing', 'i8'),
+                   ('origin', 'f8'), ('pml_origin', 'f8'),
+                   ('extended_shape', 'i8'),
+                   ('limit', 'f8'), ('extended_limit', 'f8')]
+
+    def __init__(self, shape=None, spacing=None, extra=None, absorbing=None, layout='C'):
         if isinstance(spacing, float):
             spacing = (spacing,)*len(shape)
 
         extra = extra or (0,)*len(shape)
         absorbing = absorbing or (0,)*len(shape)
 
+        if layout not in ('C', 'blocked'):
+            raise ValueError('Only "C" and "blocked" layouts are allowed.')
+
+        self.layout = layout
+        self._build_geometry(tuple(shape), tuple(spacing), tuple(extra), tuple(absorbing))
+
+    def _build_geometry(self, shape, spacing, extra, absorbing):
         self.dim = len(shape)
-        self.shape = tuple(shape)
-        self.spacing = tuple(spacing)
-        self.extra = tuple(extra)
-        self.absorbing = tuple(absorbing)
-
-        origin = (0,) * self.dim
-        pml_origin = tuple([each_origin - each_spacing * each_extra for each_origin, each_spacing, each_extra in
-                            zip(origin, spacing, extra)])
-
-        extended_shape = tuple(np.array([dim + 2*added for dim, added in zip(shape, extra)]))
-        size = tuple(np.array(spacing) * (np.array(shape) - 1))
-        extended_size = tuple([each_origin + each_spacing * (each_shape + each_extra - 1)
-                               for each_origin, each_spacing, each_shape, each_extra in zip(origin, spacing, shape, extra)])
-
-        self.origin = origin
-        self.pml_origin = pml_origin
-        self.extended_shape = extended_shape
-        self.limit = size
-        self.extended_limit = extended_size
+
+        geom = np.zeros(self.dim, dtype=self._geom_dtype)
+        geom['shape'] = shape
+        geom['spacing'] = spacing
+        geom['extra'] = extra
+        geom['absorbing'] = absorbing
+
+        geom['pml_origin'] = geom['origin'] - geom['spacing'] * geom['extra']
+        geom['extended_shape'] = geom['shape'] + 2*geom['extra']
+        geom['limit'] = geom['spacing'] * (geom['shape'] - 1)
+        geom['extended_limit'] = geom['origin'] + geom['spacing'] * (geom['shape'] + geom['extra'] - 1)
+
+        self._geom = geom
+
+        self._inner = tuple(slice(each_extra, each_extra + each_shape)
+                            for each_shape, each_extra in zip(shape, extra))
+
+        self._grid = None
+        self._extended_grid = None
+        self._inner_mask = None
+        self._inner_mask_bool = None
+
+    @property
+    def shape(self):
+        """
+        Shape of the inner domain, as a tuple.
+
+        """
+        return tuple(self._geom['shape'].tolist())
+
+    @property
+    def spacing(self):
+        """
+        Axis-wise spacing of the grid, as a tuple.
+
+        """
+        return tuple(self._geom['spacing'].tolist())
+
+    @property
+    def extra(self):
+        """
+        Amount of axis-wise extra space around the inner domain, as a tuple.
+
+        """
+        return tuple(self._geom['extra'].tolist())
+
+    @property
+    def absorbing(self):
+        """
+        Portion of the extra space that corresponds to absorbing boundaries, as a tuple.
+
+        """
+        return tuple(self._geom['absorbing'].tolist())
+
+    @property
+    def origin(self):
+        """
+        Origin of the inner domain, as a tuple.
+
+        """
+        return tuple(self._geom['origin'].tolist())
+
+    @property
+    def pml_origin(self):
+        """
+        Origin of the extended domain, as a tuple.
+
+        """
+        return tuple(self._geom['pml_origin'].tolist())
+
+    @property
+    def extended_shape(self):
+        """
+        Shape of the extended domain, as a tuple.
+
+        """
+        return tuple(self._geom['extended_shape'].tolist())
+
+    @property
+    def limit(self):
+        """
+        Extent of the inner domain, as a tuple.
+
+        """
+        return tuple(self._geom['limit'].tolist())
+
+    @property
+    def extended_limit(self):
+        """
+        Extent of the extended domain, as a tuple.
+
+        """
+        return tuple(self._geom['extended_limit'].tolist())
 
     @property
     def size(self):
@@ -78,17 +177,32 @@ class Space:
         if isinstance(spacing, float):
             spacing = (spacing,)*self.dim
 
-        shape = tuple((np.array(self.size) / np.array(spacing) + 1).astype(int))
+        geom = self._geom
+        spacing_arr = np.asarray(spacing)
+
+        shape = tuple((geom['limit'] / spacing_arr + 1).astype(int).tolist())
 
         if extra is None:
-            extra = tuple((np.array(self.spacing) * (np.array(self.extra) - 1) /
-                           np.array(spacing) + 1).astype(int))
+            extra = tuple((geom['spacing'] * (geom['extra'] - 1) /
+                           spacing_arr + 1).astype(int).tolist())
 
         if absorbing is None:
-            absorbing = tuple((np.array(self.spacing) * (np.array(self.absorbing) - 1) /
-                               np.array(spacing) + 1).astype(int))
+            absorbing = tuple((geom['spacing'] * (geom['absorbing'] - 1) /
+                               spacing_arr + 1).astype(int).tolist())
+
+        space = Space.__new__(Space)
+        space.layout = self.layout
+        space._build_geometry(shape, tuple(spacing), tuple(extra), tuple(absorbing))
+
+        # the 1d axes only depend on spacing and derived shape, so they can
+        # be carried over when the sampling does not change
+        if space.spacing == self.spacing:
+            space._grid = self._grid
 
-        return Space(shape=shape, spacing=spacing, extra=extra, absorbing=absorbing)
+            if space.extra == self.extra:
+                space._extended_grid = self._extended_grid
+
+        return space
 
     @property
     def inner(self):
@@ -96,7 +210,7 @@ class Space:
         Slices defining the inner domain, as a tuple of slices.
 
         """
-        return tuple([slice(extra, extra + shape) for shape, extra in zip(self.shape, self.extra)])
+        return self._inner
 
     @property
     def inner_mask(self):
@@ -105,93 +219,296 @@ class Space:
         and those outside set to 0, as an ndarray.
 
         """
-        mask = np.zeros(self.extended_shape, dtype=np.float32)
-        pml_slices = self.inner
+        if self._inner_mask is None:
+            self._inner_mask = self._build_inner_mask(np.float32, 1.)
+
+        return self._inner_mask
+
+    @property
+    def inner_mask_bool(self):
+        """
+        Tensor of the shape of the space grid with gridpoints within the inner domain set
+        to ``True`` and those outside set to ``False``, as an ndarray.
+
+        """
+        if self._inner_mask_bool is None:
+            self._inner_mask_bool = self._build_inner_mask(bool, True)
+
+        return self._inner_mask_bool
+
+    def _build_inner_mask(self, dtype, inner_value):
+        """
+        Build the inner-domain mask without zero-filling the whole extended
+        buffer, touching only the halo rings and the inner slab.
+
+        """
+        mask = np.empty(self.extended_shape, dtype=dtype)
 
-        mask[pml_slices] = 1.
+        full_slices = (slice(None),) * self.dim
+        for dim in range(self.dim):
+            each_extra = self.extra[dim]
+            each_shape = self.shape[dim]
+
+            pre_slices = list(full_slices)
+            pre_slices[dim] = slice(0, each_extra)
+            mask[tuple(pre_slices)] = 0
+
+            post_slices = list(full_slices)
+            post_slices[dim] = slice(each_extra + each_shape, None)
+            mask[tuple(post_slices)] = 0
+
+        mask[self._inner] = inner_value
 
         return mask
 
-    @cached_property
-    def mesh_indices(self):
+    @property
+    def block_shape(self):
+        """
+        Shape of a traversal tile in the extended domain, as a tuple.
+
+        Tiles are sized so that a float32 tile fits within a typical L2
+        cache, clipped to the extended shape along each axis.
+
+        """
+        block_edge = max(1, int(round(self._block_elements ** (1 / self.dim))))
+
+        return tuple(min(block_edge, each_shape) for each_shape in self.extended_shape)
+
+    @property
+    def num_blocks(self):
+        """
+        Number of traversal tiles along each axis of the extended domain, as a tuple.
+
+        """
+        return tuple(-(-each_shape // each_block)
+                     for each_shape, each_block in zip(self.extended_shape, self.block_shape))
+
+    def gather(self, field, block_index):
+        """
+        Gather a contiguous traversal tile of a grid-shaped field.
+
+        Fields remain stored in C order; when the space is created with the
+        ``blocked`` layout, downstream consumers can traverse them tile by
+        tile through this method so that each tile stays resident in cache.
+
+        Parameters
+        ----------
+        field : ndarray
+            Field of the shape of the extended domain (or the inner domain).
+        block_index : tuple
+            Axis-wise index of the tile to gather.
+
+        Returns
+        -------
+        ndarray
+            Contiguous tile of the field.
+
+        """
+        block_slices = tuple(slice(each_index*each_block, (each_index + 1)*each_block)
+                             for each_index, each_block in zip(block_index, self.block_shape))
+
+        return np.ascontiguousarray(field[block_slices])
+
+    def mesh_indices(self, sparse=True, dtype=np.int32):
         """
         Create the mesh of indices in the inner domain, as a tuple
         of ndarray.
 
+        By default the mesh is sparse, with each axis reshaped so that it
+        broadcasts along its own dimension. The mesh follows ``ij`` indexing,
+        with each axis of the mesh matching the corresponding axis of the grid.
+
+        Parameters
+        ----------
+        sparse : bool, optional
+            Whether to return the mesh in sparse form, defaults to ``True``.
+        dtype : data-type, optional
+            Dtype of the generated axes, defaults to ``np.int32`` to avoid
+            upcasting broadcast expressions against the float32 grid.
+
+        Returns
+        -------
+        tuple of ndarray
+            Mesh axes, sparse or dense.
+
         """
-        grid = [np.arange(0, shape) for shape in self.shape]
-        return np.meshgrid(*grid)
+        return tuple(np.indices(self.shape, sparse=sparse, dtype=dtype))
 
-    @cached_property
-    def extended_mesh_indices(self):
+    def extended_mesh_indices(self, sparse=True, dtype=np.int32):
         """
         Create the mesh of indices in the extended domain, as a tuple
         of ndarray.
 
+        By default the mesh is sparse, with each axis reshaped so that it
+        broadcasts along its own dimension. The mesh follows ``ij`` indexing,
+        with each axis of the mesh matching the corresponding axis of the grid.
+
+        Parameters
+        ----------
+        sparse : bool, optional
+            Whether to return the mesh in sparse form, defaults to ``True``.
+        dtype : data-type, optional
+            Dtype of the generated axes, defaults to ``np.int32`` to avoid
+            upcasting broadcast expressions against the float32 grid.
+
+        Returns
+        -------
+        tuple of ndarray
+            Mesh axes, sparse or dense.
+
+        """
+        return tuple(np.indices(self.extended_shape, sparse=sparse, dtype=dtype))
+
+    def axes(self):
+        """
+        Contiguous float32 1d-arrays for each axis of the inner domain.
+
+        Unlike ``mesh``, the returned axes carry no broadcasting shape, which
+        makes them suitable for JIT-compiled consumers (e.g. Numba kernels)
+        that loop over the axes with explicit index arithmetic.
+
+        Returns
+        -------
+        tuple of ndarray
+            Axes of the inner domain.
+
+        """
+        return tuple(np.ascontiguousarray(axis) for axis in self.grid)
+
+    def extended_axes(self):
+        """
+        Contiguous float32 1d-arrays for each axis of the extended domain.
+
+        Unlike ``extended_mesh``, the returned axes carry no broadcasting
+        shape, which makes them suitable for JIT-compiled consumers (e.g.
+        Numba kernels) that loop over the axes with explicit index arithmetic.
+
+        Returns
+        -------
+        tuple of ndarray
+            Axes of the extended domain.
+
+        """
+        return tuple(np.ascontiguousarray(axis) for axis in self.extended_grid)
+
+    def _axis_reshaped(self, dim, extended=False):
+        """
+        Return the 1d-array of axis ``dim`` reshaped so that it broadcasts
+        along its own dimension of the domain.
+
         """
-        grid = [np.arange(0, extended_shape) for extended_shape in self.extended_shape]
-        return np.meshgrid(*grid)
+        grid = self.extended_grid if extended else self.grid
+        shape = self.extended_shape if extended else self.shape
 
-    @cached_property
-    def mesh(self):
+        return grid[dim].reshape(tuple(each_shape if d == dim else 1 for d, each_shape in enumerate(shape)))
+
+    def mesh(self, sparse=True):
         """
         Create the mesh of spatial locations in the inner domain, as a tuple
         of ndarray.
 
+        By default the mesh is sparse, with each axis reshaped so that it
+        broadcasts along its own dimension. This keeps memory at O(N) per axis
+        while arithmetic on the axes produces the same result as a dense mesh.
+
+        Parameters
+        ----------
+        sparse : bool, optional
+            Whether to return the mesh in sparse form, defaults to ``True``.
+            In the dense case the axes are read-only broadcast views, with
+            no memory allocated; callers that need to write into them should
+            copy explicitly.
+
+        Returns
+        -------
+        tuple of ndarray
+            Mesh axes, sparse or dense.
+
         """
-        grid = self.grid
-        return np.meshgrid(*grid, indexing='ij')
+        axes = tuple(self._axis_reshaped(dim) for dim in range(self.dim))
+
+        if sparse:
+            return axes
 
-    @cached_property
-    def extended_mesh(self):
+        return tuple(np.broadcast_to(axis, self.shape) for axis in axes)
+
+    def extended_mesh(self, sparse=True):
         """
-        Create the mesh of spatial locations the full, extended domain, as a tuple
+        Create the mesh of spatial locations in the full, extended domain, as a tuple
         of ndarray.
 
+        By default the mesh is sparse, with each axis reshaped so that it
+        broadcasts along its own dimension. This keeps memory at O(N) per axis
+        while arithmetic on the axes produces the same result as a dense mesh.
+
+        Parameters
+        ----------
+        sparse : bool, optional
+            Whether to return the mesh in sparse form, defaults to ``True``.
+            In the dense case the axes are read-only broadcast views, with
+            no memory allocated; callers that need to write into them should
+            copy explicitly.
+
+        Returns
+        -------
+        tuple of ndarray
+            Mesh axes, sparse or dense.
+
         """
-        grid = self.extended_grid
-        return np.meshgrid(*grid, indexing='ij')
+        axes = tuple(self._axis_reshaped(dim, extended=True) for dim in range(self.dim))
+
+        if sparse:
+            return axes
 
-    @cached_property
+        return tuple(np.broadcast_to(axis, self.extended_shape) for axis in axes)
+
+    @property
     def indices(self):
         """
         Indices corresponding to the grid of the inner domain, as a tuple of 1d-arrays.
 
         """
-        axes = [np.arange(0, shape) for shape in self.shape]
+        axes = [np.arange(0, shape, dtype=np.int32) for shape in self.shape]
         return tuple(axes)
 
-    @cached_property
+    @property
     def extended_indices(self):
         """
         Indices corresponding to the grid of the extended domain, as a tuple of 1d-arrays.
 
         """
-        axes = [np.arange(0, extended_shape) for extended_shape in self.extended_shape]
+        axes = [np.arange(0, extended_shape, dtype=np.int32) for extended_shape in self.extended_shape]
         return tuple(axes)
 
-    @cached_property
+    @property
     def grid(self):
         """
         Spatial points corresponding to the grid of the inner domain, as a tuple of 1d-arrays.
 
         """
-        axes = [np.linspace(self.origin[dim], self.limit[dim], self.shape[dim],
-                            endpoint=True, dtype=np.float32)
-                for dim in range(self.dim)]
-        return tuple(axes)
+        if self._grid is None:
+            # the inner axes are contiguous slices of the extended axes, so
+            # they can share the same backing buffers
+            extended_grid = self.extended_grid
+            self._grid = tuple(extended_axis[each_extra:each_extra + each_shape]
+                               for extended_axis, each_extra, each_shape in
+                               zip(extended_grid, self.extra, self.shape))
 
-    @cached_property
+        return self._grid
+
+    @property
     def extended_grid(self):
         """
         Spatial points corresponding to the grid of the extended domain, as a tuple of 1d-arrays.
 
-
         """
-        axes = [np.linspace(self.pml_origin[dim], self.extended_limit[dim], self.extended_shape[dim],
-                            endpoint=True, dtype=np.float32)
-                for dim in range(self.dim)]
-        return tuple(axes)
+        if self._extended_grid is None:
+            self._extended_grid = tuple(np.float32(self.pml_origin[dim])
+                                        + np.arange(self.extended_shape[dim], dtype=np.float32)
+                                        * np.float32(self.spacing[dim])
+                                        for dim in range(self.dim))
+
+        return self._extended_grid
 
 
 class Time:
@@ -216,20 +533,23 @@ class Time:
 
     """
 
+    __slots__ = ('start', 'stop', 'step', 'num',
+                 'extra', 'extended_start', 'extended_stop', 'extended_num',
+                 '_inner', '_grid', '_extended_grid')
+
     def __init__(self, start=None, step=None, num=None, stop=None):
-        try:
-            if start is None:
-                start = stop - step*(num - 1)
-            elif step is None:
-                step = (stop - start)/(num - 1)
-            elif num is None:
-                num = int(np.ceil((stop - start)/step + 1))
-                stop = step*(num - 1) + start
-            elif stop is None:
-                stop = start + step*(num - 1)
-
-        except:
-            raise ValueError('Three of args start, step, num and stop may be set')
+        if (start, step, num, stop).count(None) > 1:
+            raise ValueError('At least three of args start, step, num and stop must be set')
+
+        if start is None:
+            start = stop - step*(num - 1)
+        elif step is None:
+            step = (stop - start)/(num - 1)
+        elif num is None:
+            num = int(np.ceil((stop - start)/step + 1))
+            stop = step*(num - 1) + start
+        elif stop is None:
+            stop = start + step*(num - 1)
 
         if not isinstance(num, int):
             raise TypeError('"input" argument must be of type int')
@@ -244,12 +564,21 @@ class Time:
         self.extended_stop = stop
         self.extended_num = num
 
+        self._inner = slice(self.extra, self.extra + self.num)
+        self._grid = None
+        self._extended_grid = None
+
     def extend(self, extra):
         self.extra = extra
         self.extended_start = self.start - (self.extra[0] - 1)*self.step
         self.extended_stop = self.stop + (self.extra[1] - 1)*self.step
         self.extended_num = self.num + self.extra[0] + self.extra[1]
 
+        self._inner = slice(self.extra[0], self.extra[0] + self.num)
+        # the extended axis depends on the padding, so the memoized
+        # version has to be rebuilt on next access
+        self._extended_grid = None
+
     def resample(self):
         raise NotImplementedError('Resampling has not been implemented yet')
 
@@ -259,23 +588,30 @@ class Time:
         Slice defining the inner domain.
 
         """
-        return slice(self.extra, self.extra + self.num)
+        return self._inner
 
-    @cached_property
+    @property
     def grid(self):
         """
         Time points corresponding to the grid of the inner domain, as a 1d-array.
 
         """
-        return np.linspace(self.start, self.stop, self.num, endpoint=True, dtype=np.float32)
+        if self._grid is None:
+            self._grid = np.linspace(self.start, self.stop, self.num, endpoint=True, dtype=np.float32)
+
+        return self._grid
 
-    @cached_property
+    @property
     def extended_grid(self):
         """
         Time points corresponding to the grid of the extended domain, as a 1d-array.
 
         """
-        return np.linspace(self.extended_start, self.extended_stop, self.extended_num, endpoint=True, dtype=np.float32)
+        if self._extended_grid is None:
+            self._extended_grid = np.linspace(self.extended_start, self.extended_stop, self.extended_num,
+                                              endpoint=True, dtype=np.float32)
+
+        return self._extended_grid
 
 
 class SlowTime:
@@ -299,18 +635,30 @@ class SlowTime:
 
     """
 
+    __slots__ = ('start', 'stop', 'frame_step', 'frame_rate', 'num_frame',
+                 'acq_step', 'acq_rate', 'num_acq', '_grid')
+
     def __init__(self, frame_rate=None, acq_rate=None,
                  frame_step=None, acq_step=None,
                  num_frame=None, num_acq=None):
-        try:
-            if frame_step is None:
-                frame_step = 1/frame_rate
-            else:
-                frame_rate = 1/frame_step
+        (frame_step, frame_rate, num_frame,
+         acq_step, acq_rate, num_acq) = self._validate_args(frame_rate, acq_rate,
+                                                            frame_step, acq_step,
+                                                            num_frame, num_acq)
 
-        except:
+        self._build(frame_step, frame_rate, num_frame,
+                    acq_step, acq_rate, num_acq)
+
+    @staticmethod
+    def _validate_args(frame_rate, acq_rate, frame_step, acq_step, num_frame, num_acq):
+        if frame_step is None and frame_rate is None:
             raise ValueError('Either freq or step has to be defined')
 
+        if frame_step is None:
+            frame_step = 1/frame_rate
+        else:
+            frame_rate = 1/frame_step
+
         if not isinstance(num_frame, int):
             raise TypeError('num_frames must be of type int')
 
@@ -331,6 +679,9 @@ class SlowTime:
             raise ValueError('Acquisition step (%e s) too large for frame step (%e s).'
                              % (num_acq*acq_step, frame_step))
 
+        return frame_step, frame_rate, num_frame, acq_step, acq_rate, num_acq
+
+    def _build(self, frame_step, frame_rate, num_frame, acq_step, acq_rate, num_acq):
         start = 0.
         stop = start + frame_step * (num_frame - 1)
 
@@ -343,6 +694,34 @@ class SlowTime:
         self.acq_rate = acq_rate
         self.num_acq = num_acq
 
+        self._grid = None
+
+    @classmethod
+    def from_validated(cls, frame_step, frame_rate, num_frame, acq_step, acq_rate, num_acq):
+        """
+        Create a SlowTime from already-validated values, bypassing argument
+        resolution for use in hot loops.
+
+        Parameters
+        ----------
+        frame_step : float
+        frame_rate : float
+        num_frame : int
+        acq_step : float
+        acq_rate : float
+        num_acq : int
+
+        Returns
+        -------
+        SlowTime
+
+        """
+        slow_time = cls.__new__(cls)
+        slow_time._build(frame_step, frame_rate, num_frame,
+                         acq_step, acq_rate, num_acq)
+
+        return slow_time
+
     def resample(self):
         raise NotImplementedError('Resampling has not been implemented yet')
 
@@ -370,21 +749,29 @@ class SlowTime:
         """
         return slice(0, None)
 
-    @cached_property
+    @property
     def grid(self):
         """
         Time points corresponding to the grid, as a 1d-array.
 
         """
+        if self._grid is None:
+            self._grid = self._build_grid()
+
+        return self._grid
+
+    def _build_grid(self):
         if self.acq_rate > 0:
             start = 0.
             stop = start + self.acq_step * (self.num_acq - 1)
 
-            grid = [np.linspace(start + self.frame_step*acq, stop + self.frame_step*acq,
-                                self.num_acq, endpoint=True, dtype=np.float32)
-                    for acq in range(self.num_frame)]
+            inner = np.linspace(start, stop, self.num_acq, endpoint=True, dtype=np.float32)
+            offsets = np.arange(self.num_frame, dtype=np.float32) * self.frame_step
 
-            return np.concatenate(grid)
+            grid = np.empty(self.num_frame * self.num_acq, dtype=np.float32)
+            np.add(offsets[:, None], inner[None, :], out=grid.reshape(self.num_frame, self.num_acq))
+
+            return grid
         else:
             return np.linspace(self.start, self.stop, self.num_frame, endpoint=True, dtype=np.float32)
 
@@ -400,6 +787,8 @@ class Grid:
     slow_time : SlowTime
     """
 
+    __slots__ = ('space', 'time', 'slow_time')
+
     def __init__(self, space=None, time=None, slow_time=None):
         self.space = space
         self.time = time